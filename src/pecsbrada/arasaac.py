@@ -18,41 +18,212 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import bisect
 import json
 import os
+import pickle
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from importlib import resources
 from pathlib import Path
 from typing import Optional, List, Dict
 from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 from urllib.parse import quote
 
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 ARASAAC_API = "https://api.arasaac.org/v1"
 ARASAAC_IMAGE = "https://static.arasaac.org/pictograms/{picto_id}/{picto_id}_{resolution}.png"
 VALID_RESOLUTIONS = [300, 500, 2500]
+NEG_CACHE_TTL = 3600  # seconds before an unknown term is retried
+
+HTTP_HEADERS = {
+    "User-Agent": "Pecsbrada-Swedish-Ordlista/1.0",
+    "Accept": "application/json",
+}
+
+# Shared keep-alive pool (api.arasaac.org + static.arasaac.org), so batch
+# lookups don't pay a fresh TCP+TLS handshake per request.
+_http = urllib3.PoolManager(num_pools=2, maxsize=8, headers=HTTP_HEADERS) if urllib3 else None
+
+
+def _http_get_conditional(url: str, etag: Optional[str],
+                          timeout: float = 10) -> tuple:
+    """Conditional GET: returns (status, body, etag).
+
+    Sends If-None-Match when an ETag is known; a 304 comes back with an
+    empty body in a single round-trip, letting the caller reuse its
+    cached payload.
+    """
+    headers = dict(HTTP_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if _http is not None:
+        try:
+            resp = _http.request("GET", url, headers=headers,
+                                 timeout=urllib3.Timeout(timeout))
+        except urllib3.exceptions.HTTPError as e:
+            raise URLError(e) from e
+        if resp.status == 304:
+            return 304, b"", etag
+        if resp.status >= 400:
+            raise URLError(f"HTTP {resp.status}")
+        return resp.status, resp.data, resp.headers.get("ETag")
+    req = Request(url, headers=headers)
+    try:
+        with urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read(), resp.headers.get("ETag")
+    except HTTPError as e:
+        if e.code == 304:
+            return 304, b"", etag
+        raise
+
+
+def _stream_search(url: str, max_results: int, timeout: float = 10) -> List[Dict]:
+    """Incrementally parse a search response, stopping after max_results items."""
+    if _http is not None:
+        try:
+            resp = _http.request("GET", url, timeout=urllib3.Timeout(timeout),
+                                 preload_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            raise URLError(e) from e
+        if resp.status >= 400:
+            resp.release_conn()
+            raise URLError(f"HTTP {resp.status}")
+        try:
+            return _take_items(resp, max_results)
+        finally:
+            resp.release_conn()
+    req = Request(url, headers=HTTP_HEADERS)
+    with urlopen(req, timeout=timeout) as resp:
+        return _take_items(resp, max_results)
+
+
+def _take_items(fileobj, max_results: int) -> List[Dict]:
+    results = []
+    try:
+        for item in ijson.items(fileobj, "item"):
+            if len(results) >= max_results:
+                break
+            results.append(item)
+    except ijson.JSONError:
+        pass  # truncated/invalid payload — keep whatever parsed cleanly
+    return results
+
+
+def _http_download(url: str, dest: Path, timeout: float = 15):
+    """Download a URL to dest, streaming in chunks when pooled.
+
+    Streams into a tmp sibling and renames on success — a connection
+    dropped mid-transfer must not leave a truncated file that the
+    size-based cache checks would forever treat as a valid image.
+    """
+    tmp = dest.with_suffix(dest.suffix + ".tmp")
+    if _http is not None:
+        try:
+            resp = _http.request("GET", url, timeout=urllib3.Timeout(timeout),
+                                 preload_content=False)
+            if resp.status >= 400:
+                resp.release_conn()
+                raise URLError(f"HTTP {resp.status}")
+            try:
+                with open(tmp, "wb") as f:
+                    for chunk in resp.stream(64 * 1024):
+                        f.write(chunk)
+                os.replace(tmp, dest)
+            except Exception:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            finally:
+                resp.release_conn()
+            return
+        except urllib3.exceptions.HTTPError as e:
+            raise URLError(e) from e
+    req = Request(url, headers=HTTP_HEADERS)
+    with urlopen(req, timeout=timeout) as resp:
+        tmp.write_bytes(resp.read())
+    os.replace(tmp, dest)
 
 
 def _load_json_data(filename: str) -> dict:
     """Load a JSON data file bundled with the package."""
-    # Try importlib.resources first (works with installed packages)
+    # Try importlib.resources first (works with installed packages).
+    # Read raw bytes and let the JSON parser handle UTF-8 — skips the
+    # text-IO layer, and orjson parses the 15k-entry dicts much faster.
     try:
         pkg = __name__.rsplit(".", 1)[0]  # e.g. "bildschema"
         ref = resources.files(pkg).joinpath("data").joinpath(filename)
-        return json.loads(ref.read_text(encoding="utf-8"))
+        return _json_loads(ref.read_bytes())
     except (TypeError, FileNotFoundError, ModuleNotFoundError):
         pass
     # Fallback: look in data/ relative to this file
     data_dir = Path(__file__).parent / "data"
     data_file = data_dir / filename
     if data_file.exists():
-        return json.loads(data_file.read_text(encoding="utf-8"))
+        return _json_loads(data_file.read_bytes())
     return {}
 
 
+@lru_cache(maxsize=1024)
+def _quoted(term: str) -> str:
+    """Memoized urllib quote — PECS boards reuse the same terms heavily."""
+    return quote(term)
+
+
+def _data_file_mtime(filename: str) -> float:
+    """Modification time of a bundled data file, or 0.0 if unresolvable."""
+    try:
+        return (Path(__file__).parent / "data" / filename).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
 class ArasaacProvider:
     """Enhanced ARASAAC provider with Swedish ordlista support."""
 
+    # Ordlista data is immutable once loaded, so it is shared class-wide:
+    # every instance reuses one parsed copy instead of re-reading ~15k
+    # entries per provider. Guarded by _ordlista_lock for the threaded
+    # search/download paths.
+    _en2sv: Optional[Dict[str, str]] = None
+    _sv2en: Optional[Dict[str, List[str]]] = None
+    _sv_keys_sorted: Optional[List[str]] = None
+    _ordlista_lock = threading.Lock()
+
     def __init__(self, cache_dir: Optional[str] = None):
         if cache_dir is None:
             cache_dir = os.path.join(
@@ -62,68 +233,231 @@ class ArasaacProvider:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load ordlista
-        self._en2sv: Optional[Dict[str, str]] = None
-        self._sv2en: Optional[Dict[str, List[str]]] = None
-        
         # Search cache
         self._search_cache: Dict[str, List[Dict]] = {}
         self._load_search_cache()
 
+        # Known cached image filenames; populated lazily so repeat
+        # get_image_path hits need zero stat syscalls
+        self._image_name_cache: Optional[set] = None
+
+        # Negative cache: terms the API returned nothing for (or timed out
+        # on), with insertion timestamps, so unknown terms cost one failed
+        # round-trip per TTL instead of one per board render
+        self._neg_cache: Dict[str, float] = {}
+        self._load_neg_cache()
+
+        # Per-instance memo for translate_sv; bound here (not on the class)
+        # so it cannot leak entries across providers.
+        self._translate_cached = lru_cache(maxsize=4096)(
+            lambda en_lower: self._get_en2sv().get(en_lower))
+
     def _get_en2sv(self) -> Dict[str, str]:
-        """Lazy-load English → Swedish ordlista."""
-        if self._en2sv is None:
-            self._en2sv = _load_json_data("arasaac_en2sv.json")
-        return self._en2sv
+        """Lazy-load English → Swedish ordlista (shared across instances)."""
+        if ArasaacProvider._en2sv is None:
+            with ArasaacProvider._ordlista_lock:
+                if ArasaacProvider._en2sv is None:
+                    ArasaacProvider._en2sv = _load_json_data("arasaac_en2sv.json")
+        return ArasaacProvider._en2sv
 
     def _get_sv2en(self) -> Dict[str, List[str]]:
-        """Lazy-load Swedish → English reverse lookup."""
-        if self._sv2en is None:
-            en2sv = self._get_en2sv()
-            sv2en = {}
-            for en_term, sv_term in en2sv.items():
-                if sv_term not in sv2en:
-                    sv2en[sv_term] = []
-                sv2en[sv_term].append(en_term)
-            self._sv2en = sv2en
-        return self._sv2en
+        """Lazy-load Swedish → English reverse lookup.
+
+        The inversion of the 15k-entry ordlista is pickled to the cache dir
+        so later runs skip both the JSON parse and the rebuild.
+        """
+        if ArasaacProvider._sv2en is None:
+            with ArasaacProvider._ordlista_lock:
+                if ArasaacProvider._sv2en is None:
+                    ArasaacProvider._sv2en = self._build_sv2en()
+        return ArasaacProvider._sv2en
+
+    def _build_sv2en(self) -> Dict[str, List[str]]:
+        pkl = self.cache_dir / "sv2en.pkl"
+        src_mtime = _data_file_mtime("arasaac_en2sv.json")
+        try:
+            if pkl.stat().st_mtime > src_mtime:
+                return pickle.loads(pkl.read_bytes())
+        except Exception:
+            # A zero-byte or torn pickle raises more than UnpicklingError
+            # (EOFError, ValueError, ...); any failure means rebuild
+            pass
+        sv2en = defaultdict(list)
+        for en_term, sv_term in _load_json_data("arasaac_en2sv.json").items():
+            sv2en[sv_term].append(en_term)
+        sv2en = dict(sv2en)
+        # Write-then-rename so a crash mid-write can't leave the torn
+        # pickle this method would then choke on next run
+        try:
+            tmp = pkl.with_suffix(".pkl.tmp")
+            tmp.write_bytes(pickle.dumps(sv2en, protocol=5))
+            os.replace(tmp, pkl)
+        except OSError:
+            pass
+        return sv2en
+
+    def _get_sv_keys_sorted(self) -> List[str]:
+        """Sorted Swedish ordlista keys, for binary-search prefix matching."""
+        if ArasaacProvider._sv_keys_sorted is None:
+            sv2en = self._get_sv2en()  # outside the lock — it locks itself
+            with ArasaacProvider._ordlista_lock:
+                if ArasaacProvider._sv_keys_sorted is None:
+                    ArasaacProvider._sv_keys_sorted = sorted(sv2en)
+        return ArasaacProvider._sv_keys_sorted
+
+    def _sv_prefix_matches(self, prefix: str, max_keys: int = 3) -> List[str]:
+        """Find ordlista keys starting with prefix — O(log N + K), not a scan."""
+        keys = self._get_sv_keys_sorted()
+        matches = []
+        i = bisect.bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            matches.append(keys[i])
+            if len(matches) >= max_keys:
+                break
+            i += 1
+        return matches
 
     def translate_sv(self, en_term: str) -> str:
         """Get Swedish label for an English keyword, or return original."""
-        return self._get_en2sv().get(en_term.lower(), en_term)
+        return self._translate_cached(en_term.lower()) or en_term
 
     def _load_search_cache(self):
-        """Load search cache from disk."""
-        cache_file = self.cache_dir / "search_cache_v2.json"
+        """Load search cache from disk (append-only JSONL, one entry per line)."""
+        self._cache_lines = 0
+        cache_file = self.cache_dir / "search_cache_v2.jsonl"
         if cache_file.exists():
             try:
-                self._search_cache = json.loads(cache_file.read_text())
-            except (json.JSONDecodeError, OSError):
+                with open(cache_file, "rb") as f:
+                    for line in f:
+                        try:
+                            self._search_cache.update(_json_loads(line))
+                        except ValueError:
+                            continue
+                        self._cache_lines += 1
+            except OSError:
                 self._search_cache = {}
+        else:
+            # Migrate from the old single-JSON format
+            legacy = self.cache_dir / "search_cache_v2.json"
+            if legacy.exists():
+                try:
+                    self._search_cache = json.loads(legacy.read_text())
+                except (json.JSONDecodeError, OSError):
+                    self._search_cache = {}
+                if self._search_cache:
+                    # Write the legacy entries out in the new format right
+                    # away — the next run reads only the JSONL, so entries
+                    # left in memory would be lost
+                    self._rewrite_cache()
+        atexit.register(self._compact_cache)
+
+    def _append_cache_entry(self, cache_key: str):
+        """Append one cache entry to disk — O(1) vs rewriting the whole file."""
+        cache_file = self.cache_dir / "search_cache_v2.jsonl"
+        try:
+            with open(cache_file, "ab") as f:
+                f.write(_json_dumps({cache_key: self._search_cache[cache_key]})
+                        + b"\n")
+            self._cache_lines += 1
+        except OSError:
+            pass
+
+    def _compact_cache(self):
+        """Rewrite the JSONL cache once stale lines outnumber live entries."""
+        if self._cache_lines <= 2 * len(self._search_cache):
+            return
+        self._rewrite_cache()
+
+    def _rewrite_cache(self):
+        """Write the whole in-memory cache as a fresh JSONL file."""
+        cache_file = self.cache_dir / "search_cache_v2.jsonl"
+        try:
+            tmp = cache_file.with_suffix(".jsonl.tmp")
+            with open(tmp, "wb") as f:
+                for key, value in self._search_cache.items():
+                    f.write(_json_dumps({key: value}) + b"\n")
+            os.replace(tmp, cache_file)
+            self._cache_lines = len(self._search_cache)
+        except OSError:
+            pass
 
-    def _save_search_cache(self):
-        """Save search cache to disk."""
-        cache_file = self.cache_dir / "search_cache_v2.json"
+    def _load_neg_cache(self):
+        """Load the negative cache, dropping entries past their TTL."""
+        neg_file = self.cache_dir / "neg_cache.json"
         try:
-            cache_file.write_text(json.dumps(self._search_cache, ensure_ascii=False))
+            entries = _json_loads(neg_file.read_bytes())
+            cutoff = time.time() - NEG_CACHE_TTL
+            self._neg_cache = {k: ts for k, ts in entries.items() if ts > cutoff}
+        except (OSError, ValueError):
+            self._neg_cache = {}
+
+    def _save_neg_cache(self):
+        neg_file = self.cache_dir / "neg_cache.json"
+        try:
+            neg_file.write_bytes(_json_dumps(self._neg_cache))
         except OSError:
             pass
 
-    def _api_search(self, term: str, lang: str = "en") -> List[Dict]:
-        """Search ARASAAC API for pictograms."""
-        encoded_term = quote(term)
+    def _api_search(self, term: str, lang: str = "en",
+                    max_results: Optional[int] = None) -> List[Dict]:
+        """Search ARASAAC API for pictograms.
+
+        When max_results is given and ijson is available, the response is
+        parsed incrementally and abandoned once enough items have arrived,
+        instead of materializing the full result list first.
+        """
+        if max_results == 0:
+            # A zero budget answers itself; hitting the API (or the
+            # negative cache) would misrecord the term
+            return []
+        neg_key = f"{lang}:{term.lower()}"
+        if time.time() - self._neg_cache.get(neg_key, 0) < NEG_CACHE_TTL:
+            return []
+
+        encoded_term = _quoted(term)
         url = f"{ARASAAC_API}/pictograms/{lang}/search/{encoded_term}"
-        
+
+        # Cached raw response + ETag, so a revalidation can come back as a
+        # bodyless 304 instead of the full payload
+        api_key = f"api:{neg_key}"
+        cached = self._search_cache.get(api_key)
+
         try:
-            req = Request(url, headers={
-                "Accept": "application/json",
-                "User-Agent": "Pecsbrada-Swedish-Ordlista/1.0"
-            })
-            with urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read())
-                return data if isinstance(data, list) else []
+            if cached and cached.get("etag"):
+                status, body, etag = _http_get_conditional(url, cached["etag"])
+                if status == 304:
+                    results = cached["results"]
+                else:
+                    data = json.loads(body)
+                    results = data if isinstance(data, list) else []
+                    self._cache_api_response(api_key, results, etag)
+            elif ijson is not None and max_results is not None:
+                # Streaming abandons the body early, so no ETag is captured
+                results = _stream_search(url, max_results)
+            else:
+                status, body, etag = _http_get_conditional(url, None)
+                data = json.loads(body)
+                results = data if isinstance(data, list) else []
+                self._cache_api_response(api_key, results, etag)
         except (URLError, json.JSONDecodeError, KeyError):
-            return []
+            results = []
+        # Negative-cache on the full response, before truncation — a tiny
+        # max_results must not record a term the API knows as "no results"
+        if not results:
+            self._neg_cache[neg_key] = time.time()
+            self._save_neg_cache()
+        if max_results is not None:
+            results = results[:max_results]
+        return results
+
+    def _cache_api_response(self, api_key: str, results: List[Dict],
+                            etag: Optional[str]):
+        """Remember a raw API response with its ETag for later revalidation."""
+        if not etag:
+            return
+        self._search_cache[api_key] = {"etag": etag, "results": results,
+                                       "ts": time.time()}
+        self._append_cache_entry(api_key)
 
     def search_swedish(self, sv_term: str, limit: int = 20) -> List[Dict]:
         """
@@ -140,38 +474,55 @@ class ArasaacProvider:
         
         results = []
         seen_ids = set()
-        
-        # Strategy 1: Try Swedish term directly
-        swedish_results = self._api_search(sv_term, lang="sv")
-        for result in swedish_results[:limit//2]:  # Limit Swedish results
-            picto_id = result.get("_id")
-            if picto_id and picto_id not in seen_ids:
-                seen_ids.add(picto_id)
-                result["swedish_keyword"] = sv_term
-                results.append(result)
-        
-        # Strategy 2: Find English equivalents and search those
+
+        # Collect all queries upfront: the Swedish term plus up to 3 English
+        # equivalents, then run them concurrently so the wall-clock cost is
+        # roughly one RTT instead of one per query. A tiny limit can leave
+        # the Swedish budget at 0 — skip that query rather than issue it.
+        sv_budget = limit // 2
+        queries = [(sv_term, "sv", sv_budget)] if sv_budget > 0 else []
         sv2en = self._get_sv2en()
-        if sv_term_lower in sv2en:
-            english_terms = sv2en[sv_term_lower]
-            for en_term in english_terms[:3]:  # Limit English terms
-                english_results = self._api_search(en_term, lang="en")
-                for result in english_results[:5]:  # Limit per English term
-                    picto_id = result.get("_id")
-                    if picto_id and picto_id not in seen_ids:
-                        seen_ids.add(picto_id)
-                        result["swedish_keyword"] = sv_term
-                        results.append(result)
-                    
-                    if len(results) >= limit:
-                        break
+        english_terms = sv2en.get(sv_term_lower)
+        if english_terms is None:
+            # No exact ordlista hit — fall back to prefix matches found by
+            # binary search over the sorted keys
+            english_terms = [en for key in self._sv_prefix_matches(sv_term_lower)
+                             for en in sv2en[key]]
+        for en_term in english_terms[:3]:  # Limit English terms
+            queries.append((en_term, "en", 5))
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = [ex.submit(self._api_search, t, l, m) for t, l, m in queries]
+
+        # Strategy 1: Swedish results first (deterministic merge order)
+        en_futures = futures
+        if sv_budget > 0:
+            en_futures = futures[1:]
+            for result in futures[0].result()[:sv_budget]:
+                picto_id = result.get("_id")
+                if picto_id and picto_id not in seen_ids:
+                    seen_ids.add(picto_id)
+                    result["swedish_keyword"] = sv_term
+                    results.append(result)
+
+        # Strategy 2: English-equivalent results
+        for future in en_futures:
+            for result in future.result()[:5]:  # Limit per English term
+                picto_id = result.get("_id")
+                if picto_id and picto_id not in seen_ids:
+                    seen_ids.add(picto_id)
+                    result["swedish_keyword"] = sv_term
+                    results.append(result)
+
                 if len(results) >= limit:
                     break
+            if len(results) >= limit:
+                break
         
         # Cache the results
         self._search_cache[cache_key] = results[:limit]
-        self._save_search_cache()
-        
+        self._append_cache_entry(cache_key)
+
         return results[:limit]
 
     def search_english(self, en_term: str, limit: int = 20) -> List[Dict]:
@@ -181,7 +532,7 @@ class ArasaacProvider:
         if cache_key in self._search_cache:
             return self._search_cache[cache_key]
         
-        results = self._api_search(en_term, lang="en")
+        results = self._api_search(en_term, lang="en", max_results=limit)
         
         # Add Swedish keywords where available
         en2sv = self._get_en2sv()
@@ -195,8 +546,8 @@ class ArasaacProvider:
                         break
         
         self._search_cache[cache_key] = results[:limit]
-        self._save_search_cache()
-        
+        self._append_cache_entry(cache_key)
+
         return results[:limit]
 
     def search(self, term: str, lang: str = "sv") -> Optional[int]:
@@ -246,20 +597,74 @@ class ArasaacProvider:
         
         filename = f"{picto_id}_{resolution}.png"
         local_path = self.cache_dir / filename
-        
-        if local_path.exists():
+
+        if filename in self._get_image_names():
             return str(local_path)
-        
-        url = ARASAAC_IMAGE.format(picto_id=picto_id, resolution=resolution)
-        
+        # EAFP: stat once rather than exists()+open; also catches files
+        # created by another process since the name cache was built
         try:
-            req = Request(url, headers={"User-Agent": "Pecsbrada-Swedish-Ordlista/1.0"})
-            with urlopen(req, timeout=15) as resp:
-                local_path.write_bytes(resp.read())
+            if os.stat(local_path).st_size > 0:
+                self._image_name_cache.add(filename)
                 return str(local_path)
+        except OSError:
+            pass
+
+        url = ARASAAC_IMAGE.format(picto_id=picto_id, resolution=resolution)
+
+        try:
+            _http_download(url, local_path, timeout=15)
+            self._image_name_cache.add(filename)
+            return str(local_path)
         except (URLError, OSError):
             return None
 
+    def _get_image_names(self) -> set:
+        """Lazy set of cached image filenames (one scandir, no per-file stat)."""
+        if self._image_name_cache is None:
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    self._image_name_cache = {
+                        e.name for e in it if e.name.endswith(".png")}
+            except OSError:
+                self._image_name_cache = set()
+        return self._image_name_cache
+
+    def invalidate_image_cache(self):
+        """Drop the in-memory filename set after the cache dir is cleared
+        externally (e.g. the Clear button in Preferences), so stale names
+        can't resolve to deleted files."""
+        self._image_name_cache = None
+
+    def get_image_paths(self, picto_ids: List[int], resolution: int = 300) -> List[Optional[str]]:
+        """Download and cache several pictogram images, fetching misses in parallel.
+
+        Returns paths in the same order as picto_ids (None for failures).
+        Cached images are resolved without touching the network; the
+        remaining downloads overlap their round-trips on a thread pool
+        sharing the keep-alive connection pool.
+        """
+        if resolution not in VALID_RESOLUTIONS:
+            resolution = min(VALID_RESOLUTIONS, key=lambda r: abs(r - resolution))
+
+        paths: Dict[int, Optional[str]] = {}
+        names = self._get_image_names()
+        misses = []
+        for picto_id in picto_ids:
+            filename = f"{picto_id}_{resolution}.png"
+            if filename in names:
+                paths[picto_id] = str(self.cache_dir / filename)
+            else:
+                misses.append(picto_id)
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                futures = {pid: ex.submit(self.get_image_path, pid, resolution)
+                           for pid in set(misses)}
+            for pid, future in futures.items():
+                paths[pid] = future.result()
+
+        return [paths.get(pid) for pid in picto_ids]
+
     def get_pictogram(self, term: str, lang: str = "sv", resolution: int = 300) -> Optional[str]:
         """Search for term and return first matching pictogram image path."""
         picto_id = self.search(term, lang=lang)
@@ -268,12 +673,12 @@ class ArasaacProvider:
         return None
 
 
-_default_provider: Optional[ArasaacProvider] = None
-
-
+@cache
 def get_provider() -> ArasaacProvider:
-    """Get or create the default ARASAAC provider."""
-    global _default_provider
-    if _default_provider is None:
-        _default_provider = ArasaacProvider()
-    return _default_provider
+    """Get or create the default ARASAAC provider.
+
+    functools.cache makes the singleton thread-safe for the parallel
+    search/download workers; tests can reset it via
+    get_provider.cache_clear().
+    """
+    return ArasaacProvider()
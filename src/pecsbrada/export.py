@@ -5,6 +5,11 @@ import io
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import gettext
 _ = gettext.gettext
 
@@ -20,19 +25,26 @@ gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gio, GLib
 
 
-def sentence_to_csv(words, categories):
-    """Export current sentence and available cards as CSV."""
-    output = io.StringIO()
+def sentence_to_csv(words, categories, fileobj=None):
+    """Export current sentence and available cards as CSV.
+
+    Writes into fileobj when given (avoiding the StringIO → str → file
+    double copy); otherwise returns the CSV text.
+    """
+    output = fileobj if fileobj is not None else io.StringIO()
     writer = csv.writer(output)
     writer.writerow([_("Current Sentence")])
     writer.writerow([" ".join(words) if words else _("(empty)")])
     writer.writerow([])
     writer.writerow([_("Category"), _("Card"), _("Emoji")])
-    for cat_name, items in categories.items():
-        for emoji, label, term in items:
-            writer.writerow([cat_name, label, emoji])
+    # One C-level writerows call instead of one writerow per card
+    writer.writerows((cat_name, label, emoji)
+                     for cat_name, items in categories.items()
+                     for emoji, label, term in items)
     writer.writerow([])
     writer.writerow([f"{APP_LABEL} v{__version__} — {WEBSITE}"])
+    if fileobj is not None:
+        return None
     return output.getvalue()
 
 
@@ -49,6 +61,10 @@ def sentence_to_json(words, categories):
             for cat, items in categories.items()
         },
     }
+    if orjson is not None:
+        # C-level serializer with native indent support — much faster than
+        # the stdlib pretty-printer for large category dicts
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
@@ -63,8 +79,26 @@ def sentence_to_pdf(words, output_path):
             return False
 
     width, height = 595, 842
+    now = datetime.now()
+    dt_str = now.strftime("%Y-%m-%d %H:%M")
+    date_str = now.strftime("%Y-%m-%d")
     surface = cairo.PDFSurface(output_path, width, height)
-    ctx = cairo.Context(surface)
+
+    # Draw each page onto a recording surface and replay it to the PDF
+    # backend in one paint, so the many small show_text/fill operations
+    # are batched instead of emitted into the PDF stream one by one.
+    recording = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, None)
+    ctx = cairo.Context(recording)
+
+    def _flush_page(last=False):
+        nonlocal recording, ctx
+        pdf_ctx = cairo.Context(surface)
+        pdf_ctx.set_source_surface(recording, 0, 0)
+        pdf_ctx.paint()
+        if not last:
+            surface.show_page()
+            recording = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, None)
+            ctx = cairo.Context(recording)
 
     # Title
     ctx.set_font_size(24)
@@ -74,7 +108,7 @@ def sentence_to_pdf(words, output_path):
     ctx.set_font_size(12)
     ctx.set_source_rgb(0.5, 0.5, 0.5)
     ctx.move_to(40, 70)
-    ctx.show_text(datetime.now().strftime("%Y-%m-%d %H:%M"))
+    ctx.show_text(dt_str)
     ctx.set_source_rgb(0, 0, 0)
 
     # Sentence in large text
@@ -88,7 +122,8 @@ def sentence_to_pdf(words, output_path):
     ctx.set_font_size(20)
     for word in words:
         if y > height - 60:
-            surface.show_page()
+            _flush_page()
+            ctx.set_font_size(20)
             y = 40
         # Card box
         ctx.set_source_rgb(0.95, 0.95, 0.95)
@@ -103,8 +138,9 @@ def sentence_to_pdf(words, output_path):
     ctx.set_font_size(9)
     ctx.set_source_rgb(0.5, 0.5, 0.5)
     ctx.move_to(40, height - 20)
-    ctx.show_text(f"{APP_LABEL} v{__version__} — {WEBSITE} — {datetime.now().strftime('%Y-%m-%d')}")
+    ctx.show_text(f"{APP_LABEL} v{__version__} — {WEBSITE} — {date_str}")
 
+    _flush_page(last=True)
     surface.finish()
     return True
 
@@ -151,7 +187,8 @@ def _on_text_done(fd, result, content, ext, status_callback):
     except GLib.Error:
         return
     try:
-        with open(gfile.get_path(), "w") as f:
+        with open(gfile.get_path(), "w", encoding="utf-8",
+                  buffering=131072, newline="") as f:
             f.write(content)
         if status_callback:
             status_callback(_("Exported %s") % ext.upper())
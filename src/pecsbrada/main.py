@@ -1,7 +1,9 @@
 """PECS-bräda - Digital PECS communication board with text-to-speech."""
 import json
+import os
 import sys
 import gettext
+from importlib import resources
 from pathlib import Path
 
 import gi
@@ -9,10 +11,24 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gio, GLib
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 from pecsbrada import __version__
-from pecsbrada.window import PecsbradaWindow
-from pecsbrada.accessibility import apply_large_text
-from pecsbrada.accessibility import AccessibilityManager
 
 TEXTDOMAIN = "pecsbrada"
 gettext.textdomain(TEXTDOMAIN)
@@ -20,31 +36,79 @@ _ = gettext.gettext
 
 APP_ID = "se.yeager.pecsbrada"
 CONFIG_DIR = Path(GLib.get_user_config_dir()) / "pecsbrada"
+CACHE_DIR = Path(GLib.get_user_cache_dir()) / "arasaac"
+
+# Shared setting ↔ combo-index maps, hoisted so the event handlers don't
+# rebuild them on every invocation
+_THEME_SCHEMES = {
+    "light": Adw.ColorScheme.FORCE_LIGHT,
+    "dark": Adw.ColorScheme.FORCE_DARK,
+    "system": Adw.ColorScheme.DEFAULT,
+}
+_THEME_IDX = {"system": 0, "light": 1, "dark": 2}
+_THEME_FROM_IDX = {0: "system", 1: "light", 2: "dark"}
+_SIZE_IDX = {"small": 0, "medium": 1, "large": 2}
+_SIZE_FROM_IDX = {0: "small", 1: "medium", 2: "large"}
+_ENGINE_IDX = {"auto": 0, "piper": 1, "espeak": 2}
+_ENGINE_FROM_IDX = {0: "auto", 1: "piper", 2: "espeak"}
 
 def _load_settings():
     path = CONFIG_DIR / "settings.json"
     if path.exists():
         try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
+            return _json_loads(path.read_bytes())
+        except (ValueError, OSError):
             pass
     return {}
 
+def _cache_dir_size(path):
+    """Total file size under path, using scandir's cached DirEntry stats."""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.is_file(follow_symlinks=False):
+                        total += e.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return total
+
 def _save_settings(settings):
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    (CONFIG_DIR / "settings.json").write_text(
-        json.dumps(settings, indent=2, ensure_ascii=False))
+    # Write-then-rename so a crash mid-write can't leave a truncated file
+    # that silently wipes preferences on the next load
+    tmp = CONFIG_DIR / "settings.json.tmp"
+    tmp.write_bytes(_json_dumps(settings))
+    os.replace(tmp, CONFIG_DIR / "settings.json")
 
 class PecsbradaApp(Adw.Application):
     def __init__(self):
         super().__init__(application_id=APP_ID,
-        GLib.set_application_name(_("PECS Board"))
                          flags=Gio.ApplicationFlags.DEFAULT_FLAGS)
+        GLib.set_application_name(_("PECS Board"))
         self.settings = _load_settings()
+        # Per-run memo only — never persisted into the user's settings
+        self.settings.pop("_cache_size_cache", None)  # scrub old versions
+        self._cache_size_memo = None
+        self._prefs_dialog = None
+        self._shortcuts_win = None
+        self._welcome_dialog = None
+        self._save_pending = 0
 
     def do_activate(self):
-        apply_large_text()
-        win = self.props.active_window or PecsbradaWindow(application=self)
+        # Imported here rather than at module load so the heavy window /
+        # pictogram module graph doesn't delay application startup
+        from pecsbrada.window import PecsbradaWindow
+        from pecsbrada.accessibility import AccessibilityManager
+
+        win = self.props.active_window
+        if not win:
+            win = PecsbradaWindow(application=self)
+            AccessibilityManager(win, self)
         self._apply_theme()
         self._apply_tts_settings()
         win.present()
@@ -55,15 +119,36 @@ class PecsbradaApp(Adw.Application):
         Adw.Application.do_startup(self)
         self._setup_actions()
 
+    def do_shutdown(self):
+        if self._save_pending:
+            GLib.source_remove(self._save_pending)
+            self._save_pending = 0
+            _save_settings(self.settings)
+        Adw.Application.do_shutdown(self)
+
+    def _schedule_save(self):
+        """Coalesce settings writes: one disk write 500 ms after the last
+        change instead of one per toggle/slider tick."""
+        if self._save_pending:
+            return
+        self._save_pending = GLib.timeout_add(500, self._flush_save)
+
+    def _flush_save(self):
+        self._save_pending = 0
+        _save_settings(self.settings)
+        return False
+
+    def _apply_tts_settings(self):
+        from pecsbrada import tts
+        tts.configure({
+            "engine": self.settings.get("tts_engine", "auto"),
+            "speed": self.settings.get("tts_speed", 1.0),
+        })
+
     def _apply_theme(self):
         theme = self.settings.get("theme", "system")
-        mgr = Adw.StyleManager.get_default()
-        schemes = {
-            "light": Adw.ColorScheme.FORCE_LIGHT,
-            "dark": Adw.ColorScheme.FORCE_DARK,
-            "system": Adw.ColorScheme.DEFAULT,
-        }
-        mgr.set_color_scheme(schemes.get(theme, Adw.ColorScheme.DEFAULT))
+        Adw.StyleManager.get_default().set_color_scheme(
+            _THEME_SCHEMES.get(theme, Adw.ColorScheme.DEFAULT))
 
     def _setup_actions(self):
         for name, cb, accel in [
@@ -82,6 +167,9 @@ class PecsbradaApp(Adw.Application):
     # ── Welcome Dialog ───────────────────────────────────────
 
     def _show_welcome(self, win):
+        if self._welcome_dialog is not None:
+            self._welcome_dialog.present(win)
+            return
         dialog = Adw.Dialog()
         dialog.set_title(_("Welcome"))
         dialog.set_content_width(420)
@@ -112,16 +200,35 @@ class PecsbradaApp(Adw.Application):
         box.add_top_bar(hb)
         box.set_content(page)
         dialog.set_child(box)
+        self._welcome_dialog = dialog
+        # Marked as shown at presentation time, so the close handler is
+        # just a close and the dialog can be re-presented cheaply
+        self.settings["welcome_shown"] = True
+        self._schedule_save()
         dialog.present(win)
 
     def _on_welcome_close(self, btn, dialog):
-        self.settings["welcome_shown"] = True
-        _save_settings(self.settings)
         dialog.close()
 
     # ── Preferences ──────────────────────────────────────────
 
     def _on_preferences(self, *_args):
+        # Building the widget tree (two pages, rows, cache-dir scan) is
+        # expensive; construct once and just refresh the dynamic bits on
+        # later opens.
+        if self._prefs_dialog is None:
+            self._prefs_dialog = self._build_preferences()
+        else:
+            self._refresh_cache_row()
+        self._prefs_dialog.present(self.props.active_window)
+
+    def _refresh_cache_row(self):
+        cache_size = self._get_cache_size(CACHE_DIR)
+        self._cache_row.set_subtitle(f"{cache_size / (1024*1024):.1f} MB")
+        self._clear_btn.set_sensitive(True)
+        self._clear_btn.set_label(_("Clear"))
+
+    def _build_preferences(self):
         prefs = Adw.PreferencesDialog()
         prefs.set_title(_("Preferences"))
 
@@ -137,8 +244,7 @@ class PecsbradaApp(Adw.Application):
         theme_row.set_subtitle(_("Choose light, dark, or follow system"))
         theme_row.set_model(Gtk.StringList.new(
             [_("System"), _("Light"), _("Dark")]))
-        cur = {"system": 0, "light": 1, "dark": 2}.get(
-            self.settings.get("theme", "system"), 0)
+        cur = _THEME_IDX.get(self.settings.get("theme", "system"), 0)
         theme_row.set_selected(cur)
         theme_row.connect("notify::selected", self._on_theme_changed)
         appearance.add(theme_row)
@@ -148,8 +254,7 @@ class PecsbradaApp(Adw.Application):
         size_row.set_subtitle(_("Size of pictogram icons"))
         size_row.set_model(Gtk.StringList.new(
             [_("Small"), _("Medium"), _("Large")]))
-        cur_size = {"small": 0, "medium": 1, "large": 2}.get(
-            self.settings.get("icon_size", "medium"), 1)
+        cur_size = _SIZE_IDX.get(self.settings.get("icon_size", "medium"), 1)
         size_row.set_selected(cur_size)
         size_row.connect("notify::selected", self._on_icon_size_changed)
         appearance.add(size_row)
@@ -176,8 +281,7 @@ class PecsbradaApp(Adw.Application):
         engine_row.set_subtitle(_("Piper gives natural voices, espeak is robotic but lightweight"))
         engine_row.set_model(Gtk.StringList.new(
             [_("Automatic"), _("Piper (natural)"), _("espeak-ng (robotic)")]))
-        cur_engine = {"auto": 0, "piper": 1, "espeak": 2}.get(
-            self.settings.get("tts_engine", "auto"), 0)
+        cur_engine = _ENGINE_IDX.get(self.settings.get("tts_engine", "auto"), 0)
         engine_row.set_selected(cur_engine)
         engine_row.connect("notify::selected", self._on_tts_engine_changed)
         speech_group.add(engine_row)
@@ -205,9 +309,7 @@ class PecsbradaApp(Adw.Application):
 
         cache_group = Adw.PreferencesGroup()
         cache_group.set_title(_("ARASAAC Cache"))
-        cache_dir = Path(GLib.get_user_cache_dir()) / "arasaac"
-        cache_size = sum(f.stat().st_size for f in cache_dir.glob("*")
-                         if f.is_file()) if cache_dir.exists() else 0
+        cache_size = self._get_cache_size(CACHE_DIR)
         cache_row = Adw.ActionRow()
         cache_row.set_title(_("Cached pictograms"))
         cache_row.set_subtitle(f"{cache_size / (1024*1024):.1f} MB")
@@ -217,6 +319,8 @@ class PecsbradaApp(Adw.Application):
         clear_btn.connect("clicked", self._on_clear_cache, cache_row)
         cache_row.add_suffix(clear_btn)
         cache_group.add(cache_row)
+        self._cache_row = cache_row
+        self._clear_btn = clear_btn
         advanced.add(cache_group)
 
         debug_group = Adw.PreferencesGroup()
@@ -230,36 +334,67 @@ class PecsbradaApp(Adw.Application):
         advanced.add(debug_group)
 
         prefs.add(advanced)
-        prefs.present(self.props.active_window)
+        return prefs
+
+    def _get_cache_size(self, cache_dir):
+        """Cache-dir size, memoized on the directory mtime so repeat
+        preference opens skip the walk."""
+        try:
+            mtime_ns = os.stat(cache_dir).st_mtime_ns
+        except OSError:
+            return 0
+        memo = self._cache_size_memo
+        if memo and memo[0] == mtime_ns:
+            return memo[1]
+        size = _cache_dir_size(cache_dir)
+        self._cache_size_memo = (mtime_ns, size)
+        return size
 
     def _on_theme_changed(self, row, *_):
-        themes = {0: "system", 1: "light", 2: "dark"}
-        self.settings["theme"] = themes.get(row.get_selected(), "system")
-        _save_settings(self.settings)
+        self.settings["theme"] = _THEME_FROM_IDX.get(
+            row.get_selected(), "system")
+        self._schedule_save()
         self._apply_theme()
 
     def _on_icon_size_changed(self, row, *_):
-        sizes = {0: "small", 1: "medium", 2: "large"}
-        self.settings["icon_size"] = sizes.get(row.get_selected(), "medium")
-        _save_settings(self.settings)
+        self.settings["icon_size"] = _SIZE_FROM_IDX.get(
+            row.get_selected(), "medium")
+        self._schedule_save()
 
     def _on_tts_changed(self, row, *_):
         self.settings["tts_on_tap"] = row.get_active()
-        _save_settings(self.settings)
+        self._schedule_save()
+
+    def _on_tts_engine_changed(self, row, *_):
+        self.settings["tts_engine"] = _ENGINE_FROM_IDX.get(
+            row.get_selected(), "auto")
+        self._schedule_save()
+        self._apply_tts_settings()
+
+    def _on_tts_speed_changed(self, scale):
+        self.settings["tts_speed"] = round(scale.get_value(), 2)
+        self._schedule_save()
+        self._apply_tts_settings()
 
     def _on_clear_cache(self, btn, row):
-        cache_dir = Path(GLib.get_user_cache_dir()) / "arasaac"
-        if cache_dir.exists():
-            for f in cache_dir.glob("*"):
-                if f.is_file():
-                    f.unlink()
+        try:
+            with os.scandir(CACHE_DIR) as it:
+                for e in it:
+                    if e.is_file(follow_symlinks=False):
+                        os.unlink(e.path)
+        except OSError:
+            pass
+        # The provider's filename set now claims files that are gone
+        from pecsbrada import arasaac
+        arasaac.get_provider().invalidate_image_cache()
+        self._cache_size_memo = None
         row.set_subtitle("0.0 MB")
         btn.set_sensitive(False)
         btn.set_label(_("Cleared"))
 
     def _on_debug_changed(self, row, *_):
         self.settings["debug"] = row.get_active()
-        _save_settings(self.settings)
+        self._schedule_save()
 
     # ── Export ────────────────────────────────────────────────
 
@@ -314,55 +449,13 @@ class PecsbradaApp(Adw.Application):
     # ── Shortcuts ────────────────────────────────────────────
 
     def _on_shortcuts(self, *_args):
-        builder = Gtk.Builder()
-        builder.add_from_string('''
-        <interface>
-          <object class="GtkShortcutsWindow" id="shortcuts">
-            <property name="modal">true</property>
-            <child>
-              <object class="GtkShortcutsSection">
-                <child>
-                  <object class="GtkShortcutsGroup">
-                    <property name="title" translatable="yes">General</property>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Export</property>
-                        <property name="accelerator">&lt;Control&gt;e</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Preferences</property>
-                        <property name="accelerator">&lt;Control&gt;comma</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Keyboard Shortcuts</property>
-                        <property name="accelerator">&lt;Control&gt;slash</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">About</property>
-                        <property name="accelerator">F1</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Quit</property>
-                        <property name="accelerator">&lt;Control&gt;q</property>
-                      </object>
-                    </child>
-                  </object>
-                </child>
-              </object>
-            </child>
-          </object>
-        </interface>''')
-        win = builder.get_object("shortcuts")
-        win.set_transient_for(self.props.active_window)
-        win.present()
+        if self._shortcuts_win is None:
+            ref = resources.files("pecsbrada").joinpath("data/shortcuts.ui")
+            builder = Gtk.Builder.new_from_string(
+                ref.read_text(encoding="utf-8"), -1)
+            self._shortcuts_win = builder.get_object("shortcuts")
+        self._shortcuts_win.set_transient_for(self.props.active_window)
+        self._shortcuts_win.present()
 
 def main():
     app = PecsbradaApp()
@@ -10,14 +10,60 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
 import shutil
 import subprocess
 import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import espeakng  # in-process bindings; spares a fork per utterance
+except ImportError:
+    espeakng = None
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """shutil.which walks $PATH with a stat per entry — cache the result."""
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=1)
+def _player_cmd() -> tuple[str, ...] | None:
+    """Resolve the WAV player command once instead of per playback."""
+    for player in ["aplay", "paplay", "pw-play", "ffplay"]:
+        exe = _which(player)
+        if exe:
+            if player == "ffplay":
+                return (exe, "-nodisp", "-autoexit")
+            return (exe,)
+    return None
+
+
+# Piper's --output_raw format: mono s16le at 22050 Hz
+_RAW_PLAYER_ARGS = {
+    "paplay": ("--raw", "--rate=22050", "--channels=1", "--format=s16le"),
+    "pw-play": ("--rate", "22050", "--channels", "1", "--format", "s16", "-"),
+    "aplay": ("-q", "-t", "raw", "-f", "S16_LE", "-r", "22050", "-c", "1", "-"),
+}
+
+
+@lru_cache(maxsize=1)
+def _raw_player_cmd() -> tuple[str, ...] | None:
+    """Player command that accepts raw PCM on stdin, if one exists."""
+    for player, args in _RAW_PLAYER_ARGS.items():
+        exe = _which(player)
+        if exe:
+            return (exe, *args)
+    return None
+
 
 def get_current_lang():
     """Get current UI language code for TTS."""
@@ -56,9 +102,15 @@ _settings: dict = {
 }
 
 
+# Resolved (lang, voice, dir) → model Path, so the per-utterance hot path
+# skips the dict/fallback/Path dance; cleared whenever settings change
+_resolved_models: dict = {}
+
+
 def configure(settings: dict):
     """Update TTS settings from app preferences."""
     _settings.update(settings)
+    _resolved_models.clear()
 
 
 def get_settings() -> dict:
@@ -68,7 +120,7 @@ def get_settings() -> dict:
 
 def _find_piper() -> tuple[str | None, Path | None]:
     """Find piper binary and voice directory."""
-    piper = shutil.which("piper")
+    piper = _which("piper")
     if not piper:
         return None, None
     candidates = [
@@ -80,8 +132,14 @@ def _find_piper() -> tuple[str | None, Path | None]:
     if xdg:
         candidates.insert(0, Path(xdg) / "piper-voices")
     for d in candidates:
-        if d.exists() and any(d.glob("*.onnx")):
-            return piper, d
+        # scandir instead of glob: no Path allocation per entry, and the
+        # iteration stops at the first .onnx hit
+        try:
+            with os.scandir(d) as it:
+                if any(e.name.endswith(".onnx") and e.is_file() for e in it):
+                    return piper, d
+        except OSError:
+            continue
     return piper, None
 
 
@@ -95,15 +153,38 @@ def _get_piper() -> tuple[str | None, Path | None]:
     return (_piper_path or None), _voice_dir
 
 
+_voice_set_cache: dict[tuple, set[str]] = {}
+
+
+def _onnx_names(voice_dir: Path) -> set[str]:
+    """Set of .onnx basenames in voice_dir, cached on the dir's mtime."""
+    try:
+        key = (str(voice_dir), os.stat(voice_dir).st_mtime_ns)
+    except OSError:
+        return set()
+    names = _voice_set_cache.get(key)
+    if names is None:
+        try:
+            with os.scandir(voice_dir) as it:
+                names = {e.name for e in it if e.name.endswith(".onnx")}
+        except OSError:
+            names = set()
+        _voice_set_cache.clear()  # old mtime entries are dead weight
+        _voice_set_cache[key] = names
+    return names
+
+
 def get_available_voices(lang: str = "sv") -> list[tuple[str, str]]:
     """Return list of (voice_id, display_name) for given language."""
     voices = []
     _, voice_dir = _get_piper()
     if voice_dir:
+        # One scandir + set membership instead of a stat per declared voice
+        present = _onnx_names(voice_dir)
         for vid, name in PIPER_VOICES.get(lang, []):
-            if (voice_dir / f"{vid}.onnx").exists():
+            if f"{vid}.onnx" in present:
                 voices.append((vid, f"Piper: {name}"))
-    espeak = shutil.which("espeak-ng") or shutil.which("espeak")
+    espeak = _which("espeak-ng") or _which("espeak")
     if espeak:
         voices.append(("espeak", "espeak-ng"))
     return voices
@@ -111,20 +192,101 @@ def get_available_voices(lang: str = "sv") -> list[tuple[str, str]]:
 
 def _play_wav(wav_path: str):
     """Play a WAV file using available player."""
-    for player in ["aplay", "paplay", "pw-play", "ffplay"]:
-        exe = shutil.which(player)
-        if exe:
-            args = [exe]
-            if player == "ffplay":
-                args += ["-nodisp", "-autoexit"]
-            args.append(wav_path)
-            try:
-                subprocess.Popen(args,
-                                 stdout=subprocess.DEVNULL,
-                                 stderr=subprocess.DEVNULL)
-                return
-            except Exception:
-                continue
+    cmd = _player_cmd()
+    if not cmd:
+        return
+    try:
+        subprocess.Popen([*cmd, wav_path],
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL)
+    except Exception:
+        pass
+
+
+# Last launched synthesis/playback processes, for cancellation
+_current_procs: list[subprocess.Popen] = []
+
+# Persistent Piper daemon: forking piper per utterance reloads the ~60 MB
+# ONNX model every time, which dominates tap-to-speech latency. Keep one
+# piper --json-input process per (model, speed) alive, its raw output
+# permanently piped into one player process.
+_piper_daemon: subprocess.Popen | None = None
+_piper_player: subprocess.Popen | None = None
+_piper_daemon_key: tuple | None = None
+
+# Monotonic time until which daemon audio may still be playing, estimated
+# from the utterance length. The daemon gives no playback feedback, so
+# this is what lets _cancel_current cut off in-flight speech without
+# paying a pipeline restart when the previous utterance clearly ended.
+_piper_deadline = 0.0
+
+
+def _stop_piper_daemon():
+    """Terminate the daemon pipeline. Caller must hold _lock."""
+    global _piper_daemon, _piper_player
+    for proc in (_piper_daemon, _piper_player):
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+    _piper_daemon = None
+    _piper_player = None
+
+
+def _ensure_piper_daemon(piper: str, model_path: Path) -> subprocess.Popen | None:
+    """Start (or reuse) the persistent Piper process for this model/speed."""
+    global _piper_daemon, _piper_player, _piper_daemon_key
+    player = _raw_player_cmd()
+    if player is None:
+        return None
+    key = (str(model_path), tuple(_speed_args()))
+    with _lock:
+        if (_piper_daemon is not None and _piper_daemon.poll() is None
+                and _piper_daemon_key == key):
+            return _piper_daemon
+        _stop_piper_daemon()
+        cmd = [piper, "--model", str(model_path), "--output_raw",
+               "--json-input"] + _speed_args()
+        try:
+            daemon = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL)
+            play = subprocess.Popen(
+                player, stdin=daemon.stdout,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            daemon.stdout.close()  # the player owns the pipe now
+        except OSError:
+            return None
+        _piper_daemon = daemon
+        _piper_player = play
+        _piper_daemon_key = key
+        return daemon
+
+
+def _shutdown_piper_daemon():
+    with _lock:
+        _stop_piper_daemon()
+
+
+atexit.register(_shutdown_piper_daemon)
+
+
+@lru_cache(maxsize=8)
+def _speed_args_for(speed: float) -> tuple[str, ...]:
+    """Piper speed control via length_scale (inverse: lower = faster)."""
+    if speed != 1.0:
+        length_scale = 1.0 / max(0.3, min(3.0, speed))
+        return ("--length-scale", f"{length_scale:.2f}")
+    return ()
+
+
+def _speed_args() -> list[str]:
+    return list(_speed_args_for(_settings.get("speed", 1.0)))
+
+
+@lru_cache(maxsize=8)
+def _piper_wav_argv(piper: str, model_path: str, speed: float) -> tuple[str, ...]:
+    """Base argv for one-shot WAV synthesis; the output file is appended
+    per call since only the tempfile name varies between utterances."""
+    return (piper, "--model", model_path, *_speed_args_for(speed))
 
 
 def speak_piper(text: str, lang: str = "sv") -> bool:
@@ -133,32 +295,56 @@ def speak_piper(text: str, lang: str = "sv") -> bool:
     if not piper or not voice_dir:
         return False
 
-    voice_key = f"piper_voice_{lang}"
-    voice_id = _settings.get(voice_key, PIPER_VOICES.get(lang, [("", "")])[0][0])
-    model_path = voice_dir / f"{voice_id}.onnx"
-    if not model_path.exists():
-        return False
+    model_path = _resolved_models.get(lang)
+    if model_path is None:
+        voice_key = f"piper_voice_{lang}"
+        voice_id = _settings.get(voice_key,
+                                 PIPER_VOICES.get(lang, [("", "")])[0][0])
+        model_path = voice_dir / f"{voice_id}.onnx"
+        if not model_path.exists():
+            return False
+        _resolved_models[lang] = model_path
+
+    # Feed the persistent daemon one JSON line per utterance; the model
+    # stays loaded, so latency is just synthesis + playback
+    for _ in range(2):  # one retry if the daemon died since last use
+        daemon = _ensure_piper_daemon(piper, model_path)
+        if daemon is None:
+            return _speak_piper_wav(piper, model_path, text)
+        try:
+            daemon.stdin.write(json.dumps({"text": text}).encode("utf-8") + b"\n")
+            daemon.stdin.flush()
+            global _piper_deadline
+            speed = _settings.get("speed", 1.0)
+            _piper_deadline = (time.monotonic()
+                               + 0.4 + 0.09 * len(text) / max(speed, 0.3))
+            return True
+        except (OSError, BrokenPipeError):
+            with _lock:
+                _stop_piper_daemon()
+    return False
+
 
+def _speak_piper_wav(piper: str, model_path: Path, text: str) -> bool:
+    """Fallback for players that can't take raw PCM on stdin."""
     try:
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
             wav_path = f.name
 
-        cmd = [piper, "--model", str(model_path), "--output_file", wav_path]
-
-        # Speed control via length_scale (inverse: lower = faster)
-        speed = _settings.get("speed", 1.0)
-        if speed != 1.0:
-            length_scale = 1.0 / max(0.3, min(3.0, speed))
-            cmd += ["--length-scale", f"{length_scale:.2f}"]
+        base = _piper_wav_argv(piper, str(model_path),
+                               _settings.get("speed", 1.0))
+        cmd = [*base, "--output_file", wav_path]
 
         proc = subprocess.run(
             cmd, input=text.encode("utf-8"),
             capture_output=True, timeout=15)
 
-        if proc.returncode == 0 and os.path.exists(wav_path):
+        # NamedTemporaryFile already guarantees the file exists, so no
+        # extra stat — a vanished file just makes the player no-op
+        if proc.returncode == 0:
             _play_wav(wav_path)
             def cleanup():
-                import time; time.sleep(10)
+                time.sleep(10)
                 try: os.unlink(wav_path)
                 except OSError: pass
             threading.Thread(target=cleanup, daemon=True).start()
@@ -168,42 +354,118 @@ def speak_piper(text: str, lang: str = "sv") -> bool:
     return False
 
 
+# Reused espeakng.Speaker so the engine initializes once per process
+# instead of once per utterance
+_espeak_speaker = None
+
+
+def _get_espeak_speaker(voice: str, wpm: int, pitch_val: int):
+    global _espeak_speaker
+    if _espeak_speaker is None:
+        _espeak_speaker = espeakng.Speaker()
+    _espeak_speaker.voice = voice
+    _espeak_speaker.wpm = wpm
+    _espeak_speaker.pitch = pitch_val
+    return _espeak_speaker
+
+
 def speak_espeak(text: str, lang: str = "sv"):
     """Speak using espeak-ng (fallback)."""
-    espeak = shutil.which("espeak-ng") or shutil.which("espeak")
-    if not espeak:
-        return
     voice = ESPEAK_VOICES.get(lang, lang)
     speed = _settings.get("speed", 1.0)
     pitch = _settings.get("pitch", 1.0)
     wpm = int(130 * speed)
     pitch_val = int(50 * pitch)
+    if espeakng is not None:
+        try:
+            _get_espeak_speaker(voice, wpm, pitch_val).say(text)
+            return
+        except Exception:
+            pass  # fall through to the subprocess path
+    espeak = _which("espeak-ng") or _which("espeak")
+    if not espeak:
+        return
     try:
-        subprocess.Popen(
+        proc = subprocess.Popen(
             [espeak, "-v", voice, "-s", str(wpm), "-p", str(pitch_val), text],
             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        _current_procs[:] = [proc]
     except Exception:
         pass
 
 
+def _do_speak(text: str, lang: str):
+    engine = _settings.get("engine", "auto")
+    if engine == "espeak":
+        speak_espeak(text, lang)
+    else:  # "piper" and "auto" both fall back to espeak
+        if not speak_piper(text, lang):
+            speak_espeak(text, lang)
+
+
+# Latest-wins utterance queue drained by a single-thread executor: rapid
+# taps replace the pending utterance instead of stacking threads and
+# overlapping audio.
+_speak_queue: queue.Queue = queue.Queue(maxsize=1)
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="tts")
+            atexit.register(_executor.shutdown, wait=False,
+                            cancel_futures=True)
+    return _executor
+
+
+def _cancel_current():
+    """Stop any in-flight speech before a superseding utterance."""
+    global _piper_deadline
+    if time.monotonic() < _piper_deadline:
+        # The daemon buffers utterances internally and has no cancel
+        # command — dropping the pipeline is the only way to cut off
+        # audio. speak_piper respawns it for the next utterance.
+        with _lock:
+            _stop_piper_daemon()
+        _piper_deadline = 0.0
+    if _espeak_speaker is not None:
+        try:
+            _espeak_speaker.stop()
+        except Exception:
+            pass
+    for proc in _current_procs:
+        if proc.poll() is None:
+            proc.terminate()
+    _current_procs.clear()
+
+
+def _drain_one():
+    try:
+        text, lang = _speak_queue.get_nowait()
+    except queue.Empty:
+        return  # superseded: a newer speak() already replaced this item
+    _cancel_current()
+    _do_speak(text, lang)
+
+
 def speak(text: str, lang: str = "sv"):
     """Speak text using best available TTS engine.
 
-    Respects engine preference from settings.
-    Runs in background thread.
+    Respects engine preference from settings. Queued to a single
+    background worker; a newer request replaces an unspoken older one.
     """
-    def _do_speak():
-        engine = _settings.get("engine", "auto")
-        if engine == "piper":
-            if not speak_piper(text, lang):
-                speak_espeak(text, lang)
-        elif engine == "espeak":
-            speak_espeak(text, lang)
-        else:  # auto
-            if not speak_piper(text, lang):
-                speak_espeak(text, lang)
-
-    threading.Thread(target=_do_speak, daemon=True).start()
+    try:
+        _speak_queue.get_nowait()  # drop a pending, not-yet-spoken utterance
+    except queue.Empty:
+        pass
+    try:
+        _speak_queue.put_nowait((text, lang))
+    except queue.Full:
+        return
+    _get_executor().submit(_drain_one)
 
 
 def get_tts_info() -> str:
@@ -211,9 +473,13 @@ def get_tts_info() -> str:
     piper, voice_dir = _get_piper()
     parts = []
     if piper and voice_dir:
-        voices = list(voice_dir.glob("*.onnx"))
-        parts.append(f"Piper ({len(voices)} voices)")
-    espeak = shutil.which("espeak-ng") or shutil.which("espeak")
+        try:
+            with os.scandir(voice_dir) as it:
+                n_voices = sum(1 for e in it if e.name.endswith(".onnx"))
+        except OSError:
+            n_voices = 0
+        parts.append(f"Piper ({n_voices} voices)")
+    espeak = _which("espeak-ng") or _which("espeak")
     if espeak:
         parts.append("espeak-ng")
     engine = _settings.get("engine", "auto")
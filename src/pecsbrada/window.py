@@ -1,57 +1,204 @@
 """Main window for PECS-bräda."""
+import atexit
 import gettext
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Gio, GLib, GdkPixbuf
+from gi.repository import Gtk, Adw, Gdk, Gio, GLib, GObject, GdkPixbuf
 
 from . import arasaac
 from .tts import speak, get_current_lang
 
 _ = gettext.gettext
+N_ = lambda s: s  # deferred-translation marker, keeps xgettext extraction
+
+# Untranslated source specs; each entry: (emoji_fallback, label_msgid,
+# arasaac_search_term). Translated exactly once below — handlers index
+# into the frozen tuples instead of re-running gettext lookups.
+_CAT_SPECS = (
+    (N_("Food"), (
+        ("🍎", N_("Apple"), "apple"), ("🍌", N_("Banana"), "banana"),
+        ("🥛", N_("Milk"), "milk"), ("🍞", N_("Bread"), "bread"),
+        ("💧", N_("Water"), "water"), ("🧃", N_("Juice"), "juice"),
+        ("🍪", N_("Cookie"), "cookie"), ("🧀", N_("Cheese"), "cheese"),
+        ("🍕", N_("Pizza"), "pizza"),
+    )),
+    (N_("Activities"), (
+        ("🎮", N_("Play"), "play"), ("📖", N_("Read"), "read"),
+        ("🎨", N_("Draw"), "draw"), ("🎵", N_("Music"), "music"),
+        ("🏃", N_("Run"), "run"), ("🧩", N_("Puzzle"), "puzzle"),
+        ("📺", N_("TV"), "television"), ("🛝", N_("Playground"), "playground"),
+        ("🚗", N_("Car ride"), "car"),
+    )),
+    (N_("Feelings"), (
+        ("😊", N_("Happy"), "happy"), ("😢", N_("Sad"), "sad"),
+        ("😠", N_("Angry"), "angry"), ("😰", N_("Worried"), "worried"),
+        ("😴", N_("Tired"), "tired"), ("🤗", N_("Hug"), "hug"),
+        ("😋", N_("Hungry"), "hungry"), ("🥵", N_("Hot"), "hot"),
+        ("🥶", N_("Cold"), "cold"),
+    )),
+    (N_("Actions"), (
+        ("🚽", N_("Toilet"), "toilet"), ("🖐️", N_("Help"), "help"),
+        ("✋", N_("Stop"), "stop"), ("👋", N_("Hello"), "hello"),
+        ("🙏", N_("Please"), "please"), ("❤️", N_("Thank you"), "thank you"),
+        ("➡️", N_("More"), "more"), ("🚫", N_("No"), "no"),
+        ("✅", N_("Yes"), "yes"),
+    )),
+)
 
-# Each entry: (emoji_fallback, translated_label, arasaac_search_term)
 CATEGORIES = {
-    _("Food"): [
-        ("🍎", _("Apple"), "apple"), ("🍌", _("Banana"), "banana"),
-        ("🥛", _("Milk"), "milk"), ("🍞", _("Bread"), "bread"),
-        ("💧", _("Water"), "water"), ("🧃", _("Juice"), "juice"),
-        ("🍪", _("Cookie"), "cookie"), ("🧀", _("Cheese"), "cheese"),
-        ("🍕", _("Pizza"), "pizza"),
-    ],
-    _("Activities"): [
-        ("🎮", _("Play"), "play"), ("📖", _("Read"), "read"),
-        ("🎨", _("Draw"), "draw"), ("🎵", _("Music"), "music"),
-        ("🏃", _("Run"), "run"), ("🧩", _("Puzzle"), "puzzle"),
-        ("📺", _("TV"), "television"), ("🛝", _("Playground"), "playground"),
-        ("🚗", _("Car ride"), "car"),
-    ],
-    _("Feelings"): [
-        ("😊", _("Happy"), "happy"), ("😢", _("Sad"), "sad"),
-        ("😠", _("Angry"), "angry"), ("😰", _("Worried"), "worried"),
-        ("😴", _("Tired"), "tired"), ("🤗", _("Hug"), "hug"),
-        ("😋", _("Hungry"), "hungry"), ("🥵", _("Hot"), "hot"),
-        ("🥶", _("Cold"), "cold"),
-    ],
-    _("Actions"): [
-        ("🚽", _("Toilet"), "toilet"), ("🖐️", _("Help"), "help"),
-        ("✋", _("Stop"), "stop"), ("👋", _("Hello"), "hello"),
-        ("🙏", _("Please"), "please"), ("❤️", _("Thank you"), "thank you"),
-        ("➡️", _("More"), "more"), ("🚫", _("No"), "no"),
-        ("✅", _("Yes"), "yes"),
-    ],
+    _(name): tuple((emoji, _(label), term) for emoji, label, term in items)
+    for name, items in _CAT_SPECS
 }
+CATEGORY_NAMES = tuple(CATEGORIES)
+
+
+# Scaled pictogram pixbufs keyed by (term, size), shared across category
+# switches — pixbufs are refcounted, so many Gtk.Images can show the same
+# one without re-reading and re-decoding the PNG. Bounded LRU.
+_PIXBUF_CACHE: OrderedDict = OrderedDict()
+_PIXBUF_CACHE_MAX = 128
+
+# Pre-scaled 64x64 copies persisted across runs, so a cold start decodes
+# a tiny PNG instead of rescaling the full-resolution pictogram
+_PIX64_DIR = Path(GLib.get_user_cache_dir()) / "pecsbrada" / "pix64"
+
+
+# One stylesheet for the card subtree, installed once on the default
+# display; cards then carry a single class each instead of stacking the
+# stock title-1/heading classes per widget
+_CARD_CSS = """
+.pecs-emoji { font-size: 48px; }
+.pecs-title { font-weight: bold; }
+"""
+_css_installed = False
+
+
+def _ensure_card_css():
+    global _css_installed
+    if _css_installed:
+        return
+    prov = Gtk.CssProvider()
+    try:
+        prov.load_from_string(_CARD_CSS)
+    except AttributeError:  # load_from_string is GTK 4.12+
+        prov.load_from_data(_CARD_CSS.encode(), -1)
+    Gtk.StyleContext.add_provider_for_display(
+        Gdk.Display.get_default(), prov,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+    _css_installed = True
+
+
+# Static card subtree as Builder XML: the property parsing and widget
+# wiring happen in C instead of one Python -> GObject call per property
+_PECS_CARD_XML = """\
+<interface>
+  <object class="GtkButton" id="card">
+    <property name="width-request">120</property>
+    <property name="height-request">120</property>
+    <child>
+      <object class="GtkBox" id="box">
+        <property name="orientation">vertical</property>
+        <property name="spacing">4</property>
+        <property name="valign">center</property>
+        <child>
+          <object class="GtkLabel" id="emoji">
+            <style><class name="pecs-emoji"/></style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="title">
+            <style><class name="pecs-title"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+_MAIN_MENU = None
+
+
+def _get_main_menu():
+    """Shared menu model, built lazily once and reused by every window."""
+    global _MAIN_MENU
+    if _MAIN_MENU is None:
+        menu = Gio.Menu()
+        menu.append(_("Export"), "app.export")
+        menu.append(_("Preferences"), "app.preferences")
+        menu.append(_("Keyboard Shortcuts"), "app.shortcuts")
+        menu.append(_("About PECS Board"), "app.about")
+        menu.append(_("Quit"), "app.quit")
+        _MAIN_MENU = menu
+    return _MAIN_MENU
+
+
+def _get_card_pixbuf(provider, term, size=64):
+    """Scaled pixbuf for a pictogram term, or None if unavailable."""
+    key = (term, size)
+    pixbuf = _PIXBUF_CACHE.get(key)
+    if pixbuf is not None:
+        _PIXBUF_CACHE.move_to_end(key)
+        return pixbuf
+    scaled_path = _PIX64_DIR / f"{term}.png"
+    if size == 64:
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(scaled_path))
+        except GLib.Error:
+            pixbuf = None
+    if pixbuf is None:
+        path = provider.get_pictogram(term, lang="en", resolution=96)
+        if not path:
+            return None
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+        if size == 64:
+            try:
+                _PIX64_DIR.mkdir(parents=True, exist_ok=True)
+                pixbuf.savev(str(scaled_path), "png", [], [])
+            except (GLib.Error, OSError):
+                pass
+    _PIXBUF_CACHE[key] = pixbuf
+    if len(_PIXBUF_CACHE) > _PIXBUF_CACHE_MAX:
+        _PIXBUF_CACHE.popitem(last=False)
+    return pixbuf
+
+
+class PecsItem(GObject.Object):
+    """Model object behind one PECS card in a bound FlowBox."""
+    __gtype_name__ = "PecsItem"
+
+    emoji = GObject.Property(type=str)
+    label = GObject.Property(type=str)
+    term = GObject.Property(type=str)
+
+    def __init__(self, emoji, label, term):
+        super().__init__(emoji=emoji, label=label, term=term)
 
 
 class PecsbradaWindow(Adw.ApplicationWindow):
     def __init__(self, **kwargs):
         super().__init__(**kwargs, default_width=600, default_height=700,
                          title=_("PECS Board"))
-        self.current_category = list(CATEGORIES.keys())[0]
+        self.current_category = CATEGORY_NAMES[0]
+        self._pending_speak_id = 0
+        self._icon_requested = set()
+        self._icon_pool = ThreadPoolExecutor(max_workers=2,
+                                             thread_name_prefix="picto")
+        # Drop queued loads at exit so quitting during a cold start
+        # doesn't block on dozens of pending network fetches
+        atexit.register(self._icon_pool.shutdown, wait=False,
+                        cancel_futures=True)
         self._build_ui()
+        self._prewarm_cache()
         self._start_clock()
 
     def _build_ui(self):
+        _ensure_card_css()
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.set_content(main_box)
 
@@ -64,13 +211,8 @@ class PecsbradaWindow(Adw.ApplicationWindow):
         theme_btn.connect("clicked", self._toggle_theme)
         header.pack_end(theme_btn)
 
-        menu = Gio.Menu()
-        menu.append(_("Export"), "app.export")
-        menu.append(_("Preferences"), "app.preferences")
-        menu.append(_("Keyboard Shortcuts"), "app.shortcuts")
-        menu.append(_("About PECS Board"), "app.about")
-        menu.append(_("Quit"), "app.quit")
-        menu_btn = Gtk.MenuButton(icon_name="open-menu-symbolic", menu_model=menu)
+        menu_btn = Gtk.MenuButton(icon_name="open-menu-symbolic",
+                                  menu_model=_get_main_menu())
         header.pack_end(menu_btn)
 
         # Sentence strip at top
@@ -112,7 +254,7 @@ class PecsbradaWindow(Adw.ApplicationWindow):
         cat_box.set_margin_end(8)
         cat_box.set_margin_top(8)
         first_btn = None
-        for cat_name in CATEGORIES:
+        for cat_name in CATEGORY_NAMES:
             btn = Gtk.ToggleButton(label=cat_name)
             if first_btn is None:
                 first_btn = btn
@@ -123,17 +265,16 @@ class PecsbradaWindow(Adw.ApplicationWindow):
             cat_box.append(btn)
         main_box.append(cat_box)
 
-        # Grid of PECS cards
+        # Grid of PECS cards: one pre-built FlowBox per category in a
+        # Stack, so a tab switch is a visible-child flip instead of a
+        # full teardown and rebuild of ~9 widget trees
         scrolled = Gtk.ScrolledWindow(vexpand=True)
-        self.grid = Gtk.FlowBox()
-        self.grid.set_homogeneous(True)
-        self.grid.set_max_children_per_line(4)
-        self.grid.set_min_children_per_line(3)
-        self.grid.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.grid.set_margin_start(8)
-        self.grid.set_margin_end(8)
-        self.grid.set_margin_top(8)
-        scrolled.set_child(self.grid)
+        self.stack = Gtk.Stack()
+        provider = arasaac.get_provider()
+        for cat_name, items in CATEGORIES.items():
+            self.stack.add_named(
+                self._build_category_grid(items, provider), cat_name)
+        scrolled.set_child(self.stack)
         main_box.append(scrolled)
 
         # Status
@@ -144,67 +285,126 @@ class PecsbradaWindow(Adw.ApplicationWindow):
         main_box.append(self.status_label)
 
         self.sentence_words = []
-        self._populate_grid()
+        self._sentence_str = ""
+
+    def _build_category_grid(self, items, provider):
+        grid = Gtk.FlowBox()
+        grid.set_homogeneous(True)
+        grid.set_max_children_per_line(4)
+        grid.set_min_children_per_line(3)
+        grid.set_selection_mode(Gtk.SelectionMode.NONE)
+        grid.set_margin_start(8)
+        grid.set_margin_end(8)
+        grid.set_margin_top(8)
+        # bind_model lets GTK create and recycle FlowBoxChild slots on
+        # demand instead of eagerly instantiating every card widget
+        store = Gio.ListStore.new(PecsItem)
+        for emoji, label, term in items:
+            store.append(PecsItem(emoji, label, term))
+        grid.bind_model(store, self._create_card, provider)
+        return grid
+
+    def _create_card(self, item, provider):
+        return self._make_card(item.emoji, item.label, item.term, provider)
 
-    def _populate_grid(self):
-        child = self.grid.get_first_child()
-        while child:
-            next_c = child.get_next_sibling()
-            self.grid.remove(child)
-            child = next_c
+    def _prewarm_cache(self):
+        """Queue cache warming for terms no card has requested yet.
 
-        items = CATEGORIES.get(self.current_category, [])
+        The cards themselves already submit loads for everything on a
+        board, so this only covers terms without a visible card; sharing
+        _icon_pool means each term is fetched and decoded exactly once.
+        """
         provider = arasaac.get_provider()
-        for emoji, label, term in items:
-            btn = Gtk.Button()
-            btn.set_size_request(120, 120)
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-            box.set_valign(Gtk.Align.CENTER)
+        for items in CATEGORIES.values():
+            for _emoji, _label, term in items:
+                if term not in self._icon_requested:
+                    self._icon_requested.add(term)
+                    self._icon_pool.submit(self._warm_term, provider, term)
 
-            # Try ARASAAC pictogram, fall back to emoji
-            icon_widget = None
-            try:
-                path = provider.get_pictogram(term, lang="en", resolution=96)
-                if path:
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                        path, 64, 64, True)
-                    icon_widget = Gtk.Image.new_from_pixbuf(pixbuf)
-                    icon_widget.set_pixel_size(64)
-            except Exception:
-                pass
-            if icon_widget is None:
-                icon_widget = Gtk.Label(label=emoji)
-                icon_widget.add_css_class("title-1")
-
-            box.append(icon_widget)
-            txt = Gtk.Label(label=label)
-            txt.add_css_class("heading")
-            box.append(txt)
-            btn.set_child(box)
-            btn.connect("clicked", self._on_pecs_clicked, emoji, label)
-            self.grid.insert(btn, -1)
+    def _warm_term(self, provider, term):
+        try:
+            _get_card_pixbuf(provider, term)
+        except Exception:
+            pass
+
+    def _make_card(self, emoji, label, term, provider):
+        builder = Gtk.Builder.new_from_string(_PECS_CARD_XML, -1)
+        btn = builder.get_object("card")
+        box = builder.get_object("box")
+
+        # Emoji placeholder first so the grid paints immediately; the
+        # ARASAAC fetch + PNG decode runs on a worker thread and the
+        # pictogram is swapped in from an idle callback when ready
+        icon_widget = builder.get_object("emoji")
+        icon_widget.set_label(emoji)
+        builder.get_object("title").set_label(label)
+
+        btn.connect("clicked", self._on_pecs_clicked, emoji, label)
+        self._icon_requested.add(term)
+        self._icon_pool.submit(self._load_icon, box, icon_widget,
+                               term, provider)
+        return btn
+
+    def _load_icon(self, box, placeholder, term, provider):
+        try:
+            pixbuf = _get_card_pixbuf(provider, term)
+        except Exception:
+            return
+        if pixbuf:
+            scaled_path = _PIX64_DIR / f"{term}.png"
+            if not scaled_path.exists():
+                scaled_path = None
+            GLib.idle_add(self._swap_icon, box, placeholder, pixbuf,
+                          scaled_path)
+
+    def _swap_icon(self, box, placeholder, pixbuf, scaled_path):
+        if scaled_path is not None:
+            # Gtk.Picture is backed by a GdkTexture the GL renderer
+            # uploads once, instead of per-widget pixbuf memory
+            icon = Gtk.Picture.new_for_filename(str(scaled_path))
+            icon.set_size_request(64, 64)
+            icon.set_content_fit(Gtk.ContentFit.CONTAIN)
+        else:
+            icon = Gtk.Image.new_from_pixbuf(pixbuf)
+            icon.set_pixel_size(64)
+        box.remove(placeholder)
+        box.prepend(icon)
+        return False
 
     def _on_category_changed(self, btn, cat_name):
         if btn.get_active():
             self.current_category = cat_name
-            self._populate_grid()
+            self.stack.set_visible_child_name(cat_name)
 
     def _on_pecs_clicked(self, btn, emoji, label):
         self.sentence_words.append(label)
-        display = " ".join(self.sentence_words)
-        self.sentence_label.set_label(display)
+        # O(1) append instead of re-joining the whole sentence per tap
+        self._sentence_str = (label if not self._sentence_str
+                              else self._sentence_str + " " + label)
+        self.sentence_label.set_label(self._sentence_str)
         # Try TTS for single word
         self._speak(label)
 
     def _speak(self, text):
+        # Coalesce rapid taps: only the last request within 150 ms goes
+        # to the TTS queue, so a burst of taps can't pile up overlapping
+        # audio (the queue itself then replaces any unspoken utterance)
+        if self._pending_speak_id:
+            GLib.source_remove(self._pending_speak_id)
+        self._pending_speak_id = GLib.timeout_add(150, self._speak_now, text)
+
+    def _speak_now(self, text):
+        self._pending_speak_id = 0
         speak(text, lang=get_current_lang())
+        return False
 
     def _speak_sentence(self, btn):
-        if self.sentence_words:
-            self._speak(" ".join(self.sentence_words))
+        if self._sentence_str:
+            self._speak(self._sentence_str)
 
     def _clear_sentence(self, btn):
         self.sentence_words.clear()
+        self._sentence_str = ""
         self.sentence_label.set_label(_("Tap images to build a sentence..."))
 
     def _toggle_theme(self, btn):
@@ -215,10 +415,19 @@ class PecsbradaWindow(Adw.ApplicationWindow):
             mgr.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
 
     def _start_clock(self):
-        GLib.timeout_add_seconds(1, self._update_clock)
+        # Wake once per minute, aligned to the minute boundary, instead
+        # of redrawing the label every second — 60x fewer main-loop
+        # wakeups for a display without a seconds field
+        self._update_clock()
+        delay = 60 - GLib.DateTime.new_now_local().get_seconds() % 60
+        GLib.timeout_add(int(delay * 1000), self._first_minute_tick)
+
+    def _first_minute_tick(self):
         self._update_clock()
+        GLib.timeout_add_seconds(60, self._update_clock)
+        return False
 
     def _update_clock(self):
         now = GLib.DateTime.new_now_local()
-        self.status_label.set_label(now.format("%Y-%m-%d %H:%M:%S"))
+        self.status_label.set_label(now.format("%Y-%m-%d %H:%M"))
         return True